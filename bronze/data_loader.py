@@ -12,7 +12,7 @@ import os
 import logging
 import httplib2
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 import pandas as pd
 from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.service_account import Credentials
@@ -91,6 +91,23 @@ def parse_timestamp(value):
     return None
 
 
+# Values per multi-row INSERT; keeps each statement's payload bounded
+# regardless of how wide the table is.
+BULK_INSERT_MAX_VALUES = 32000
+
+
+def bulk_insert(cursor, query, rows, page_size=None):
+    """Run an ``INSERT ... VALUES %s`` for all rows via execute_values.
+
+    page_size defaults to as many rows as fit in BULK_INSERT_MAX_VALUES.
+    """
+    if not rows:
+        return
+    if page_size is None:
+        page_size = max(1, BULK_INSERT_MAX_VALUES // len(rows[0]))
+    execute_values(cursor, query, rows, page_size=page_size)
+
+
 # ------------------------------------------------------------
 # Google Sheets
 # ------------------------------------------------------------
@@ -240,7 +257,7 @@ def load_data(table, rows, conn):
                 driver_id, driver_name, email, dob, signup_date,
                 driver_rating, city, license_number, is_active
             )
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            VALUES %s
             ON CONFLICT (driver_id) DO UPDATE SET
                 driver_name = EXCLUDED.driver_name,
                 email = EXCLUDED.email,
@@ -272,7 +289,7 @@ def load_data(table, rows, conn):
                 vehicle_id, driver_id, make, model, year,
                 plate, capacity, color, registration_date, is_active
             )
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            VALUES %s
             ON CONFLICT (vehicle_id) DO UPDATE SET
                 driver_id = EXCLUDED.driver_id,
                 make = EXCLUDED.make,
@@ -306,7 +323,7 @@ def load_data(table, rows, conn):
                 rider_id, rider_name, email, signup_date,
                 home_city, rider_rating, default_payment_method, is_verified
             )
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s)
+            VALUES %s
             ON CONFLICT (rider_id) DO UPDATE SET
                 rider_name = EXCLUDED.rider_name,
                 email = EXCLUDED.email,
@@ -340,7 +357,7 @@ def load_data(table, rows, conn):
                 surge_multiplier, base_fare_usd, tax_usd, tip_usd,
                 total_fare_usd, status
             )
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            VALUES %s
             ON CONFLICT (trip_id) DO UPDATE SET
                 rider_id = EXCLUDED.rider_id,
                 driver_id = EXCLUDED.driver_id,
@@ -391,7 +408,7 @@ def load_data(table, rows, conn):
                 payment_method, amount_usd, tip_usd,
                 status, auth_code
             )
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s)
+            VALUES %s
             ON CONFLICT (payment_id) DO UPDATE SET
                 trip_id = EXCLUDED.trip_id,
                 payment_date = EXCLUDED.payment_date,
@@ -420,8 +437,13 @@ def load_data(table, rows, conn):
         cursor.close()
         return
 
+    # One multi-row INSERT per page instead of one round trip per row.
+    # A single statement can't ON CONFLICT-update the same key twice, so
+    # collapse duplicate keys up front (last row wins, as with executemany).
+    data = list({row[0]: row for row in data}.values())
+
     try:
-        cursor.executemany(query, data)
+        bulk_insert(cursor, query, data)
         conn.commit()
         logger.info(f"✓ Inserted {len(data)} rows into bronze.{table}")
     except Exception as e:
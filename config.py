@@ -9,6 +9,20 @@ DB_CONFIG = {
     'port': int(os.getenv('DB_PORT', '5432'))
 }
 
+# Silver builder switches (env: '1'/'true'/'yes' to enable; all off by default)
+def _env_flag(name):
+    return os.getenv(name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+SILVER_CONFIG = {
+    # Read _base tables through connectorx (Arrow) instead of the pooled psycopg2 engine
+    'use_connectorx': _env_flag('SILVER_USE_CONNECTORX'),
+    # Validate inside Postgres (SQL_VALIDATORS) instead of pulling rows into pandas
+    'pushdown_validation': _env_flag('SILVER_PUSHDOWN_VALIDATION'),
+    # With pushdown: validate straight from bronze, without building silver.<table>_base
+    'fuse_base_tables': _env_flag('SILVER_FUSE_BASE_TABLES'),
+}
+
 # Google Sheets Configuration
 GOOGLE_SHEETS_CONFIG = {
     'credentials_path': os.getenv('GOOGLE_CREDS_PATH', '/home/nineleaps/Downloads/medallion-469815-fca267526bda.json'),
@@ -78,9 +78,10 @@ def build_bronze() -> bool:
 # -----------------------------------------------------------------------------
 # Silver Layer
 # -----------------------------------------------------------------------------
-def build_silver() -> bool:
+def build_silver(force: bool = False) -> bool:
     """Build Silver layer - Transform and validate data."""
     logger.info("🥈 Building Silver Layer...")
+    silver_builder = None
     try:
         silver_builder = SilverBuilder()
 
@@ -98,6 +99,7 @@ def build_silver() -> bool:
 
         # Step 3: Deep validation in Python
         logger.info("Step 3: Performing deep validation in Python...")
+        silver_builder.select_changed_tables(force=force)
         if not silver_builder.deep_validation():
             logger.error("Failed to perform deep validation")
             return False
@@ -115,6 +117,9 @@ def build_silver() -> bool:
     except Exception as e:
         logger.exception(f"❌ Error building Silver layer: {e}")
         return False
+    finally:
+        if silver_builder is not None:
+            silver_builder.flush_etl_log()
 
 
 # -----------------------------------------------------------------------------
@@ -151,7 +156,7 @@ def build_gold() -> bool:
 # -----------------------------------------------------------------------------
 # Pipeline Orchestration
 # -----------------------------------------------------------------------------
-def run_full_pipeline() -> bool:
+def run_full_pipeline(force: bool = False) -> bool:
     """Run the complete ETL pipeline: Bronze -> Silver -> Gold."""
     start_time = datetime.now()
     logger.info("🚀 STARTING FULL MEDALLION ETL PIPELINE")
@@ -164,7 +169,7 @@ def run_full_pipeline() -> bool:
 
     # Silver (only if Bronze succeeds)
     if results["bronze"]:
-        results["silver"] = build_silver()
+        results["silver"] = build_silver(force=force)
     else:
         logger.warning("⚠️  Skipping Silver layer due to Bronze failures")
 
@@ -217,23 +222,23 @@ def main():
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force rebuild even if layer exists",
+        help="Re-validate every Silver table (disables the unchanged-table skip)",
     )
 
     args = parser.parse_args()
     logger.info(f"🎯 Target layer: {args.layer}")
     if args.force:
-        logger.info("🔄 Force rebuild enabled")
+        logger.info("🔄 Force enabled: every Silver table is re-validated")
 
     success = False
     if args.layer == "bronze":
         success = build_bronze()
     elif args.layer == "silver":
-        success = build_silver()
+        success = build_silver(force=args.force)
     elif args.layer == "gold":
         success = build_gold()
     elif args.layer == "all":
-        success = run_full_pipeline()
+        success = run_full_pipeline(force=args.force)
 
     if success:
         logger.info("✅ ETL process completed successfully")
@@ -89,7 +89,9 @@ SUPABASE_PASSWORD = quote_plus(os.getenv("SUPABASE_PASSWORD"))  # <-- fix here
 
 supabase_engine = create_engine(
     f"postgresql+psycopg2://{SUPABASE_USER}:{SUPABASE_PASSWORD}@{SUPABASE_HOST}:{SUPABASE_PORT}/{SUPABASE_DB}",
-    future=True
+    future=True,
+    # TCP keepalives so a long push over the internet isn't dropped by idle middleboxes
+    connect_args={"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10, "keepalives_count": 5},
 )
 
 
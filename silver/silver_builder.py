@@ -11,32 +11,41 @@ Key features
 3) Deep validation with Pandas (rich, row-level checks)
 4) Rejected rows captured to audit.rejected_rows as JSONB
 5) Data Quality checks (PK uniqueness, FK integrity, email uniqueness)
-6) Summary + lightweight data checksum (md5 of first 1k JSON rows)
+6) Summary + full-table data checksum (row count + md5 of per-column hash sums)
 
 Fixes
 -----
-- Rejected rows insertion now uses `json.dumps(..., default=str)` and
-  `CAST(:r AS JSONB)` so there is no `:r::jsonb` placeholder issue,
-  and no usage of `pandas.io.json`.
+- Rejected rows are serialized in one pass with
+  `DataFrame.to_json(orient='records', lines=True)` and inserted with
+  `CAST(:r AS JSONB)` so there is no `:r::jsonb` placeholder issue.
 """
 
 from __future__ import annotations
 
+import hashlib
+import inspect
+import io
 import logging
-import json
+import queue
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import quote_plus
-from typing import Optional
+from typing import Iterator, Optional
 from collections import Counter
 
 
-from sqlalchemy import create_engine, text
+import psycopg2.extensions
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
-
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.sql.elements import TextClause
 
 # ---------------- Config import ----------------
 # Expect a config.py one level up:
@@ -49,7 +58,14 @@ from sqlalchemy.engine import Engine
 # }
 # LOG_CONFIG = {"log_dir": "logs", "level": "INFO", "format": "..."}
 sys.path.append(str(Path(__file__).parent.parent))
-from config import DB_CONFIG, LOG_CONFIG  # noqa: E402
+from config import DB_CONFIG, LOG_CONFIG, SILVER_CONFIG  # noqa: E402
+
+# Opt-in (SILVER_USE_CONNECTORX): connectorx streams Postgres' binary protocol straight
+# into Arrow buffers. It opens its own connections, outside the engine pool and its
+# keepalive settings, so the pooled pandas + SQLAlchemy read stays the default.
+cx = None
+if SILVER_CONFIG['use_connectorx']:
+    import connectorx as cx
 
 
 # ---------------- Logging ----------------
@@ -67,19 +83,60 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def queued_logging():
+    """Route root log records through a queue so file/console I/O runs on a
+    background listener thread; the original handlers are restored on exit."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()  # drains whatever is still queued
+        root.handlers = handlers
+
+
 # ---------------- Engine (URL-safe for @ in password) ----------------
-def make_engine() -> Engine:
+def make_db_url(scheme: str = "postgresql+psycopg2") -> str:
     user = quote_plus(DB_CONFIG["user"])
     pwd = quote_plus(DB_CONFIG["password"])
     host = DB_CONFIG["host"]
     port = DB_CONFIG["port"]
     db = DB_CONFIG["database"]
-    url = f"postgresql+psycopg2://{user}:{pwd}@{host}:{port}/{db}"
+    return f"{scheme}://{user}:{pwd}@{host}:{port}/{db}"
+
+
+# NUMERIC -> float at the driver, so reads never build per-value Decimal objects
+# (pd.read_sql's coerce_float would convert them to float64 afterwards anyway).
+DECIMAL_AS_FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values, "DECIMAL_AS_FLOAT",
+    lambda value, cur: float(value) if value is not None else None
+)
+
+# libpq TCP keepalives: idle pooled connections survive NAT/middlebox timeouts between phases
+TCP_KEEPALIVES = {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10, "keepalives_count": 5}
+
+
+def make_engine() -> Engine:
     # future=True works well with SQLAlchemy 2.x style
-    return create_engine(url, future=True)
+    # Pool sized for the concurrent per-table validations
+    eng = create_engine(make_db_url(), future=True, pool_pre_ping=True, pool_size=8, max_overflow=4,
+                        connect_args=TCP_KEEPALIVES)
+
+    @event.listens_for(eng, "connect")
+    def _numeric_as_float(dbapi_conn, _record):
+        psycopg2.extensions.register_type(DECIMAL_AS_FLOAT, dbapi_conn)
+
+    return eng
 
 
 engine = make_engine()
+# For transactions that must read bronze and build from it under one snapshot
+snapshot_engine = engine.execution_options(isolation_level="REPEATABLE READ")
 
 
 def run_sql(sql: str, params: Optional[dict] = None):
@@ -88,61 +145,380 @@ def run_sql(sql: str, params: Optional[dict] = None):
         conn.execute(text(sql), params or {})
 
 
+def run_sql_many(sql: str | TextClause, params: list[dict]):
+    """Run one statement for many parameter sets (executemany) in a single transaction."""
+    if not params:
+        return
+    with engine.begin() as conn:
+        conn.execute(text(sql) if isinstance(sql, str) else sql, params)
+
+
+def _copy_text(value) -> str:
+    """Render one value as a field of COPY's text format."""
+    if value is None:
+        return r"\N"
+    if isinstance(value, float) and value.is_integer():
+        # A chunk whose int column holds NULLs arrives as float64; "3" loads into INTEGER and FLOAT alike
+        return str(int(value))
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+# Bytes per CopyData message; psycopg2's 8 KiB default means many small messages/TLS records
+COPY_READ_SIZE = 256 * 1024
+
+
+def copy_rows(conn, target: str, columns: list[str], rows) -> None:
+    """COPY an iterable of row tuples into `target` (already quoted) over `conn`'s DBAPI connection."""
+    q = conn.dialect.identifier_preparer.quote
+    buf = io.StringIO()
+    buf.writelines("\t".join(map(_copy_text, row)) + "\n" for row in rows)
+    buf.seek(0)
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(f"COPY {target} ({', '.join(map(q, columns))}) FROM STDIN", buf, size=COPY_READ_SIZE)
+
+
+def psql_insert_copy(table, conn, keys, data_iter):
+    """`DataFrame.to_sql` method that loads each chunk with COPY FROM STDIN instead of INSERTs."""
+    q = conn.dialect.identifier_preparer.quote
+    target = f"{q(table.schema)}.{q(table.name)}" if table.schema else q(table.name)
+    copy_rows(conn, target, keys, data_iter)
+
+
+def _arrow_to_frame(table) -> pd.DataFrame:
+    """Convert a connectorx Arrow table/batch to pandas the way pd.read_sql would."""
+    import pyarrow as pa  # installed alongside connectorx
+
+    # Match pd.read_sql (coerce_float=True): NUMERIC -> float64, DATE stays a date.
+    # Go through text so values round exactly like float(Decimal(...)).
+    for i, field in enumerate(table.schema):
+        if pa.types.is_decimal(field.type):
+            col = table.column(i).cast(pa.string()).cast(pa.float64())
+            table = table.set_column(i, field.name, col)
+    return table.to_pandas()
+
+
+def _arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Move object columns holding only strings to Arrow-backed string dtype.
+
+    pandas >= 3 already does this on read when pyarrow is installed; on older
+    pandas it keeps regex/NULL checks in Arrow kernels instead of Python objects.
+    Numeric and datetime columns stay NumPy so to_sql DDL and JSON are unchanged.
+    """
+    for col in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+            try:
+                df[col] = df[col].astype("string[pyarrow]")
+            except ImportError:
+                return df
+    return df
+
+
+def read_sql_chunks(sql: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Stream a query as DataFrames of at most `chunksize` rows (0-based index each).
+
+    By default the read goes through a server-side cursor on the pooled engine;
+    with SILVER_USE_CONNECTORX, connectorx yields Arrow record batches instead.
+    Either way only one chunk is held in memory at a time.
+    """
+    if cx is not None:
+        import pyarrow as pa
+
+        reader = cx.read_sql(make_db_url("postgresql"), sql, return_type="arrow_stream", batch_size=chunksize)
+        for batch in reader:
+            yield _arrow_strings(_arrow_to_frame(pa.Table.from_batches([batch])))
+        return
+    with engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True, max_row_buffer=chunksize)
+        for chunk in pd.read_sql(text(sql), conn, chunksize=chunksize):
+            yield _arrow_strings(chunk)
+
+
+# Fingerprint of a table known to be empty (matches the '<count>:<digest>' format)
+EMPTY_FINGERPRINT = "0:0"
+
+# Fingerprint SQL templates (single-line, formatted once per object and memoized)
+FP_TEMPLATE = "SELECT CONCAT_WS(',', COUNT(*), {col_sums}) FROM {table} t"
+FP_COLUMN_TEMPLATE = "COALESCE(SUM(HASHTEXTEXTENDED(CONCAT_WS(CHR(31), {key}, {col}::TEXT), 0)::NUMERIC), 0)"
+
+# Audit statements built once and reused for every flush
+ETL_LOG_INSERT = text("""
+    INSERT INTO audit.etl_log
+    (run_id, run_timestamp, step_executed, table_name, input_row_count,
+     output_row_count, rejected_row_count, data_checksum)
+    VALUES (:run_id, :ts, :step, :table, :in_c, :out_c, :rej_c, :chk)
+""")
+
+# Canonical values produced by the payments_base CASE normalization
+ALLOWED_PAYMENT_METHODS = frozenset({'Card', 'Cash', 'Wallet', 'UPI'})
+
+EMAIL_PATTERN = r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$"
+PLATE_PATTERN = r'^[A-Z0-9\-]{3,12}$'
+
+
+def _str_match(s: pd.Series, pattern: str) -> pd.Series:
+    """Anchored regex match with NULL -> False (no fillna copy).
+
+    Runs pyarrow.compute.match_substring_regex (RE2: linear-time automaton, no
+    backtracking) directly on the column's Arrow buffer, zero-copy for
+    Arrow-backed strings; object columns are converted once. Patterns must be
+    ^...$ anchored. Without pyarrow, falls back to pandas' str.match.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return s.str.match(pattern, na=False)
+    arr = pa.array(s, type=pa.string() if s.dtype == object else None, from_pandas=True)
+    hit = pc.fill_null(pc.match_substring_regex(arr, pattern), False)
+    return pd.Series(hit.to_numpy(zero_copy_only=False), index=s.index)
+
+
+# ---------------- Per-table validators ----------------
+# Each validator yields (bad_row_mask, reason) pairs for one table's DataFrame.
+def _validate_drivers(df: pd.DataFrame):
+    critical_cols = ["driver_id", "driver_name", "license_number", "email"]
+    yield df[critical_cols].isnull().any(axis=1), "Critical column NULL"
+
+    yield ~_str_match(df['email'], EMAIL_PATTERN), 'Invalid email'
+    yield ~df['license_number'].notna(), 'Missing license number'
+    # NaN is 'unknown', not 'bad': between() is False for NaN, so mask with notna()
+    yield (df['driver_rating'].notna() & ~df['driver_rating'].between(0, 5),
+           'Driver rating out of range (0-5)')
+
+
+def _validate_vehicles(df: pd.DataFrame):
+    # ⚠️ You mentioned rider_name & rider_email, but those don’t exist in vehicles schema.
+    # Probably you meant driver_name/driver_email OR just vehicle criticals.
+    # Assuming: vehicle_id, driver_id, year, plate are critical.
+    critical_cols = ["vehicle_id", "driver_id", "year", "plate"]
+    yield df[critical_cols].isnull().any(axis=1), "Critical column NULL"
+
+    current_year = datetime.now().year
+    # year/capacity NULLs stay rejected (fillna(0) used to fall outside the range)
+    yield (df['year'].isna() | ~df['year'].between(1980, current_year + 1),
+           f'Invalid year (1980-{current_year + 1})')
+    yield df['capacity'].isna() | ~df['capacity'].between(1, 8), 'Capacity out of range (1-8)'
+    yield ~_str_match(df['plate'], PLATE_PATTERN), 'Invalid plate'
+
+
+def _validate_riders(df: pd.DataFrame):
+    critical_cols = ["rider_id", "rider_name", "email"]
+    yield df[critical_cols].isnull().any(axis=1), "Critical column NULL"
+
+    yield ~_str_match(df['email'], EMAIL_PATTERN), 'Invalid email'
+    yield (df['rider_rating'].notna() & ~df['rider_rating'].between(0, 5),
+           'Rider rating out of range (0-5)')
+
+
+# Order matters: _validate_trips slices the fare columns (last four) by position
+TRIP_NUMERIC_COLS = ['distance_km', 'duration_min', 'wait_time_minutes',
+                     'base_fare_usd', 'tax_usd', 'tip_usd', 'total_fare_usd']
+
+
+def _validate_trips(df: pd.DataFrame):
+    critical_cols = ["trip_id", "rider_id", "driver_id", "vehicle_id",
+                     "request_ts", "pickup_location", "drop_location", "total_fare_usd"]
+    yield df[critical_cols].isnull().any(axis=1), "Critical column NULL"
+
+    yield (
+        (df['pickup_ts'].notna()) & (df['request_ts'].notna()) & (df['pickup_ts'] < df['request_ts']),
+        'pickup_ts before request_ts'
+    )
+    yield (
+        (df['dropoff_ts'].notna()) & (df['pickup_ts'].notna()) & (df['dropoff_ts'] < df['pickup_ts']),
+        'dropoff_ts before pickup_ts'
+    )
+    # All numeric checks from one (rows x 7) float64 block: one extraction, one compare
+    vals = df[TRIP_NUMERIC_COLS].to_numpy(dtype=np.float64, na_value=np.nan)
+    negative = vals < 0  # NaN < 0 is False
+    for j, col in enumerate(TRIP_NUMERIC_COLS):
+        yield pd.Series(negative[:, j], index=df.index), f'Negative {col}'
+    fares = np.nan_to_num(vals[:, 3:], nan=0.0)  # base, tax, tip, total
+    yield (
+        pd.Series(np.abs(fares[:, 0] + fares[:, 1] + fares[:, 2] - fares[:, 3]) > 1e-6, index=df.index),
+        'total_fare_usd != base+tax+tip'
+    )
+
+
+def _validate_payments(df: pd.DataFrame):
+    critical_cols = ["payment_id", "trip_id", "payment_date", "payment_method", "amount_usd"]
+    yield df[critical_cols].isnull().any(axis=1), "Critical column NULL"
+
+    yield df['amount_usd'] < 0, 'Negative amount_usd'
+    yield df['tip_usd'] < 0, 'Negative tip_usd'
+    # isin() is False for NULL, so no fillna('') copy is needed
+    yield ~df['payment_method'].isin(ALLOWED_PAYMENT_METHODS), 'Unknown payment_method'
+
+
+VALIDATORS = {
+    'drivers': _validate_drivers,
+    'vehicles': _validate_vehicles,
+    'riders': _validate_riders,
+    'trips': _validate_trips,
+    'payments': _validate_payments,
+}
+
+
+# ---------------- SQL pushdown validators ----------------
+# The same rules as boolean SQL over silver.<table>_base, for pushdown_validation.
+# A predicate is TRUE for a bad row; NULL results count as "not bad" (like NaN
+# comparisons in pandas), so NULL rejection is always spelled out with IS NULL.
+def _sql_null_check(cols: list[str]) -> str:
+    return " OR ".join(f"{c} IS NULL" for c in cols)
+
+
+def _sql_validate_drivers():
+    yield _sql_null_check(["driver_id", "driver_name", "license_number", "email"]), "Critical column NULL"
+    yield "COALESCE(email, '') !~ :email_re", 'Invalid email'
+    yield "license_number IS NULL", 'Missing license number'
+    yield "driver_rating NOT BETWEEN 0 AND 5", 'Driver rating out of range (0-5)'
+
+
+def _sql_validate_vehicles():
+    yield _sql_null_check(["vehicle_id", "driver_id", "year", "plate"]), "Critical column NULL"
+    yield "year IS NULL OR year NOT BETWEEN 1980 AND :max_year", f'Invalid year (1980-{datetime.now().year + 1})'
+    yield "capacity IS NULL OR capacity NOT BETWEEN 1 AND 8", 'Capacity out of range (1-8)'
+    yield "COALESCE(plate, '') !~ :plate_re", 'Invalid plate'
+
+
+def _sql_validate_riders():
+    yield _sql_null_check(["rider_id", "rider_name", "email"]), "Critical column NULL"
+    yield "COALESCE(email, '') !~ :email_re", 'Invalid email'
+    yield "rider_rating NOT BETWEEN 0 AND 5", 'Rider rating out of range (0-5)'
+
+
+def _sql_validate_trips():
+    yield _sql_null_check(["trip_id", "rider_id", "driver_id", "vehicle_id", "request_ts",
+                           "pickup_location", "drop_location", "total_fare_usd"]), "Critical column NULL"
+    yield "pickup_ts < request_ts", 'pickup_ts before request_ts'
+    yield "dropoff_ts < pickup_ts", 'dropoff_ts before pickup_ts'
+    for col in ('distance_km', 'duration_min', 'wait_time_minutes',
+                'base_fare_usd', 'tax_usd', 'tip_usd', 'total_fare_usd'):
+        yield f"{col} < 0", f'Negative {col}'
+    yield ("ABS(COALESCE(base_fare_usd, 0) + COALESCE(tax_usd, 0) + COALESCE(tip_usd, 0)"
+           " - COALESCE(total_fare_usd, 0)) > 1e-6", 'total_fare_usd != base+tax+tip')
+
+
+def _sql_validate_payments():
+    yield _sql_null_check(["payment_id", "trip_id", "payment_date", "payment_method", "amount_usd"]), \
+        "Critical column NULL"
+    yield "amount_usd < 0", 'Negative amount_usd'
+    yield "tip_usd < 0", 'Negative tip_usd'
+    yield "payment_method IS NULL OR payment_method <> ALL(CAST(:methods AS TEXT[]))", 'Unknown payment_method'
+
+
+SQL_VALIDATORS = {
+    'drivers': _sql_validate_drivers,
+    'vehicles': _sql_validate_vehicles,
+    'riders': _sql_validate_riders,
+    'trips': _sql_validate_trips,
+    'payments': _sql_validate_payments,
+}
+
+
 class SilverBuilder:
     """Handles Silver layer ETL operations."""
 
     def __init__(self):
-        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
-        self.tables = ['drivers', 'vehicles', 'riders', 'trips', 'payments']
+        self.run_ts = datetime.now()
+        self.run_id = self.run_ts.strftime('%Y%m%d_%H%M%S')
+        self.tables = list(VALIDATORS)
         self.stats: dict[str, dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        # audit.etl_log rows waiting for flush_etl_log()
+        self._etl_log_buf: list[dict] = []
+        self._etl_log_lock = threading.Lock()
+        self.validation_workers = 5  # tables validated concurrently
+        self.index_maintenance_work_mem = '1GB'  # per index rebuild after a bulk load
         # to_sql perf knobs
+        self.read_chunksize = 250_000  # rows validated per streamed chunk
         self.to_sql_chunksize = 20000
-        self.to_sql_method = 'multi'  # let pandas batch INSERTs
+        self.to_sql_method = psql_insert_copy  # COPY each chunk instead of INSERTs
+        # Validate inside Postgres (SQL_VALIDATORS) instead of pulling rows into pandas.
+        # Off unless SILVER_PUSHDOWN_VALIDATION is set: rejected records are then
+        # serialized by to_jsonb, which differs from the pandas output.
+        self.pushdown_validation = SILVER_CONFIG['pushdown_validation']
+        # With pushdown_validation: skip the silver.<table>_base materialization entirely
+        # (SILVER_FUSE_BASE_TABLES)
+        self.fuse_base_tables = SILVER_CONFIG['fuse_base_tables']
+        # Per-run memo: object name -> fingerprint; an entry is dropped whenever that
+        # object is rewritten. Shared by the validation workers, hence the lock.
+        self._fingerprint_cache: dict[str, str] = {}
+        self._fingerprint_lock = threading.Lock()
+        # Fingerprint SQL generated once per object (needs its column list, so it is
+        # filled on first use); batched statements are memoized so identical batches
+        # reuse one TextClause (compiled-cache hit).
+        self._fp_sql: dict[str, str] = {}
+        self._fp_stmts: dict[tuple[str, ...], TextClause] = {}
+        # Narrowed by select_changed_tables(); bronze fingerprints feed silver.run_metadata.
+        # Taken in the transaction that builds from bronze (see snapshot_bronze_fps)
+        self.tables_to_validate = list(self.tables)
+        self._bronze_fps: dict[str, Optional[str]] = {}
 
     # ---------------- Step 1: Schemas + Audit ----------------
+    def setup_schemas_sql(self) -> list[str]:
+        """Bootstrap DDL for the silver/audit schemas (idempotent)."""
+        return ["""
+            CREATE SCHEMA IF NOT EXISTS silver;
+            CREATE SCHEMA IF NOT EXISTS audit;
+
+            CREATE TABLE IF NOT EXISTS audit.rejected_rows (
+                id SERIAL PRIMARY KEY,
+                table_name VARCHAR(100) NOT NULL,
+                record JSONB NOT NULL,
+                reason TEXT NOT NULL,
+                run_id VARCHAR(50) NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE TABLE IF NOT EXISTS audit.dq_results (
+                id SERIAL PRIMARY KEY,
+                table_name VARCHAR(100) NOT NULL,
+                check_name VARCHAR(200) NOT NULL,
+                pass_fail BOOLEAN NOT NULL,
+                bad_row_count INTEGER DEFAULT 0,
+                run_id VARCHAR(50) NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE TABLE IF NOT EXISTS audit.etl_log (
+                id SERIAL PRIMARY KEY,
+                run_id VARCHAR(50) NOT NULL,
+                run_timestamp TIMESTAMP NOT NULL,
+                step_executed VARCHAR(100) NOT NULL,
+                table_name VARCHAR(100),
+                input_row_count INTEGER,
+                output_row_count INTEGER,
+                rejected_row_count INTEGER,
+                data_checksum VARCHAR(64),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE TABLE IF NOT EXISTS silver.run_metadata (
+                table_name VARCHAR(100) NOT NULL,
+                bronze_fp BYTEA NOT NULL,
+                silver_fp BYTEA,
+                rules_fp BYTEA,
+                run_id VARCHAR(50) NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (table_name, run_id)
+            );
+            ALTER TABLE silver.run_metadata ADD COLUMN IF NOT EXISTS rules_fp BYTEA;
+
+            -- Filter columns used by downstream audit analysis
+            CREATE INDEX IF NOT EXISTS idx_rejected_rows_table_run
+                ON audit.rejected_rows (table_name, run_id);
+            CREATE INDEX IF NOT EXISTS idx_dq_results_run
+                ON audit.dq_results (run_id);
+        """]
+
     def setup_schemas(self) -> bool:
         logger.info("Setting up Silver and Audit schemas...")
         try:
-            run_sql("CREATE SCHEMA IF NOT EXISTS silver;")
-            run_sql("CREATE SCHEMA IF NOT EXISTS audit;")
-
-            run_sql("""
-                CREATE TABLE IF NOT EXISTS audit.rejected_rows (
-                    id SERIAL PRIMARY KEY,
-                    table_name VARCHAR(100) NOT NULL,
-                    record JSONB NOT NULL,
-                    reason TEXT NOT NULL,
-                    run_id VARCHAR(50) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
-
-            run_sql("""
-                CREATE TABLE IF NOT EXISTS audit.dq_results (
-                    id SERIAL PRIMARY KEY,
-                    table_name VARCHAR(100) NOT NULL,
-                    check_name VARCHAR(200) NOT NULL,
-                    pass_fail BOOLEAN NOT NULL,
-                    bad_row_count INTEGER DEFAULT 0,
-                    run_id VARCHAR(50) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
-
-            run_sql("""
-                CREATE TABLE IF NOT EXISTS audit.etl_log (
-                    id SERIAL PRIMARY KEY,
-                    run_id VARCHAR(50) NOT NULL,
-                    run_timestamp TIMESTAMP NOT NULL,
-                    step_executed VARCHAR(100) NOT NULL,
-                    table_name VARCHAR(100),
-                    input_row_count INTEGER,
-                    output_row_count INTEGER,
-                    rejected_row_count INTEGER,
-                    data_checksum VARCHAR(64),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
+            # One transaction / round-trip for the whole bootstrap batch.
+            with engine.begin() as conn:
+                conn.exec_driver_sql("\n".join(self.setup_schemas_sql()))
 
             logger.info("✅ Schemas and audit tables ready")
             return True
@@ -151,173 +527,224 @@ class SilverBuilder:
             return False
 
     # ---------------- Step 2: Base tables (Bronze -> Silver _base) ----------------
-    def create_silver_base_tables(self) -> bool:
-        logger.info("Creating Silver base tables with light cleaning...")
+    def base_table_scripts(self) -> dict[str, str]:
+        """Bronze -> silver.<table>_base CTAS script per table."""
+        # _base tables are rebuilt from bronze every run, so they are UNLOGGED (no WAL).
+        return {
+            t: f"""
+                DROP TABLE IF EXISTS silver.{t}_base;
+                CREATE UNLOGGED TABLE silver.{t}_base AS
+                {select};
+            """
+            for t, select in self.base_table_selects().items()
+        }
 
+    def base_table_selects(self) -> dict[str, str]:
+        """Bronze cleaning + dedupe query per table (the body of each _base CTAS)."""
         # Keep these as pure SQL for pushdown + reproducibility.
-        # Use ROW_NUMBER to dedupe on natural keys, keeping the "latest" by a date column.
-        sql_scripts = {
+        # Use DISTINCT ON to dedupe on natural keys, keeping the "latest" by a date column
+        # (one sort + Unique instead of a WindowAgg). Keys/dates are qualified with the
+        # bronze alias so they mean the raw columns, not the cleaned output columns.
+        return {
             'drivers': """
-                DROP TABLE IF EXISTS silver.drivers_base;
-                CREATE TABLE silver.drivers_base AS
-                WITH cleaned AS (
-                    SELECT
-                        TRIM(driver_id::TEXT) AS driver_id,
-                        TRIM(driver_name::TEXT) AS driver_name,
-                        LOWER(TRIM(email::TEXT)) AS email,
-                        NULLIF(TRIM(dob::TEXT), '')::DATE AS dob,
-                        NULLIF(TRIM(signup_date::TEXT), '')::DATE AS signup_date,
-                        CASE WHEN driver_rating IS NULL THEN NULL
-                             WHEN driver_rating::NUMERIC BETWEEN 0 AND 5 THEN driver_rating::NUMERIC
-                             ELSE NULL END AS driver_rating,
-                        TRIM(city::TEXT) AS city,
-                        TRIM(license_number::TEXT) AS license_number,
-                        CASE WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('true','1','yes') THEN TRUE
-                             WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('false','0','no') THEN FALSE
-                             ELSE NULL END AS is_active,
-                        ROW_NUMBER() OVER (PARTITION BY driver_id ORDER BY signup_date DESC NULLS LAST) AS rn
-                    FROM bronze.drivers
-                    WHERE driver_id IS NOT NULL
-                      AND driver_name IS NOT NULL
-                      AND license_number IS NOT NULL
-                      AND email IS NOT NULL
-                )
-                SELECT driver_id, driver_name, email, dob, signup_date, driver_rating,
-                       city, license_number, is_active
-                FROM cleaned WHERE rn = 1;
+                SELECT DISTINCT ON (b.driver_id)
+                    TRIM(driver_id::TEXT) AS driver_id,
+                    TRIM(driver_name::TEXT) AS driver_name,
+                    LOWER(TRIM(email::TEXT)) AS email,
+                    NULLIF(TRIM(dob::TEXT), '')::DATE AS dob,
+                    NULLIF(TRIM(signup_date::TEXT), '')::DATE AS signup_date,
+                    CASE WHEN driver_rating IS NULL THEN NULL
+                         WHEN driver_rating::NUMERIC BETWEEN 0 AND 5 THEN driver_rating::NUMERIC
+                         ELSE NULL END AS driver_rating,
+                    TRIM(city::TEXT) AS city,
+                    TRIM(license_number::TEXT) AS license_number,
+                    CASE WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('true','1','yes') THEN TRUE
+                         WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('false','0','no') THEN FALSE
+                         ELSE NULL END AS is_active
+                FROM bronze.drivers b
+                WHERE driver_id IS NOT NULL
+                  AND driver_name IS NOT NULL
+                  AND license_number IS NOT NULL
+                  AND email IS NOT NULL
+                ORDER BY b.driver_id, b.signup_date DESC NULLS LAST
             """,
 
             'vehicles': """
-                DROP TABLE IF EXISTS silver.vehicles_base;
-                CREATE TABLE silver.vehicles_base AS
-                WITH cleaned AS (
-                    SELECT
-                        TRIM(vehicle_id::TEXT) AS vehicle_id,
-                        TRIM(driver_id::TEXT) AS driver_id,
-                        INITCAP(TRIM(make::TEXT)) AS make,
-                        INITCAP(TRIM(model::TEXT)) AS model,
-                        NULLIF(year::TEXT,'')::INT AS year,
-                        UPPER(TRIM(plate::TEXT)) AS plate,
-                        NULLIF(capacity::TEXT,'')::INT AS capacity,
-                        INITCAP(TRIM(color::TEXT)) AS color,
-                        NULLIF(TRIM(registration_date::TEXT),'')::DATE AS registration_date,
-                        CASE WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('true','1','yes') THEN TRUE
-                             WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('false','0','no') THEN FALSE
-                             ELSE NULL END AS is_active,
-                        ROW_NUMBER() OVER (PARTITION BY vehicle_id ORDER BY registration_date DESC NULLS LAST) AS rn
-                    FROM bronze.vehicles
-                    WHERE vehicle_id IS NOT NULL
-                      AND driver_id IS NOT NULL
-                      AND year IS NOT NULL
-                      AND plate IS NOT NULL
-                )
-                SELECT vehicle_id, driver_id, make, model, year, plate, capacity, color, registration_date, is_active
-                FROM cleaned WHERE rn = 1;
+                SELECT DISTINCT ON (b.vehicle_id)
+                    TRIM(vehicle_id::TEXT) AS vehicle_id,
+                    TRIM(driver_id::TEXT) AS driver_id,
+                    INITCAP(TRIM(make::TEXT)) AS make,
+                    INITCAP(TRIM(model::TEXT)) AS model,
+                    NULLIF(year::TEXT,'')::INT AS year,
+                    UPPER(TRIM(plate::TEXT)) AS plate,
+                    NULLIF(capacity::TEXT,'')::INT AS capacity,
+                    INITCAP(TRIM(color::TEXT)) AS color,
+                    NULLIF(TRIM(registration_date::TEXT),'')::DATE AS registration_date,
+                    CASE WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('true','1','yes') THEN TRUE
+                         WHEN LOWER(COALESCE(is_active::TEXT,'')) IN ('false','0','no') THEN FALSE
+                         ELSE NULL END AS is_active
+                FROM bronze.vehicles b
+                WHERE vehicle_id IS NOT NULL
+                  AND driver_id IS NOT NULL
+                  AND year IS NOT NULL
+                  AND plate IS NOT NULL
+                ORDER BY b.vehicle_id, b.registration_date DESC NULLS LAST
             """,
 
             'riders': """
-                DROP TABLE IF EXISTS silver.riders_base;
-                CREATE TABLE silver.riders_base AS
-                WITH cleaned AS (
-                    SELECT
-                        TRIM(rider_id::TEXT) AS rider_id,
-                        TRIM(rider_name::TEXT) AS rider_name,
-                        LOWER(TRIM(email::TEXT)) AS email,
-                        NULLIF(TRIM(signup_date::TEXT),'')::DATE AS signup_date,
-                        INITCAP(TRIM(home_city::TEXT)) AS home_city,
-                        CASE WHEN rider_rating IS NULL THEN NULL
-                             WHEN rider_rating::NUMERIC BETWEEN 0 AND 5 THEN rider_rating::NUMERIC
-                             ELSE NULL END AS rider_rating,
-                        TRIM(default_payment_method::TEXT) AS default_payment_method,
-                        CASE WHEN LOWER(COALESCE(is_verified::TEXT,'')) IN ('true','1','yes') THEN TRUE
-                             WHEN LOWER(COALESCE(is_verified::TEXT,'')) IN ('false','0','no') THEN FALSE
-                             ELSE NULL END AS is_verified,
-                        ROW_NUMBER() OVER (PARTITION BY rider_id ORDER BY signup_date DESC NULLS LAST) AS rn
-                    FROM bronze.riders
-                    WHERE rider_id IS NOT NULL
-                      AND rider_name IS NOT NULL
-                      AND email IS NOT NULL
-                )
-                SELECT rider_id, rider_name, email, signup_date, home_city, rider_rating,
-                       default_payment_method, is_verified
-                FROM cleaned WHERE rn = 1;
+                SELECT DISTINCT ON (b.rider_id)
+                    TRIM(rider_id::TEXT) AS rider_id,
+                    TRIM(rider_name::TEXT) AS rider_name,
+                    LOWER(TRIM(email::TEXT)) AS email,
+                    NULLIF(TRIM(signup_date::TEXT),'')::DATE AS signup_date,
+                    INITCAP(TRIM(home_city::TEXT)) AS home_city,
+                    CASE WHEN rider_rating IS NULL THEN NULL
+                         WHEN rider_rating::NUMERIC BETWEEN 0 AND 5 THEN rider_rating::NUMERIC
+                         ELSE NULL END AS rider_rating,
+                    TRIM(default_payment_method::TEXT) AS default_payment_method,
+                    CASE WHEN LOWER(COALESCE(is_verified::TEXT,'')) IN ('true','1','yes') THEN TRUE
+                         WHEN LOWER(COALESCE(is_verified::TEXT,'')) IN ('false','0','no') THEN FALSE
+                         ELSE NULL END AS is_verified
+                FROM bronze.riders b
+                WHERE rider_id IS NOT NULL
+                  AND rider_name IS NOT NULL
+                  AND email IS NOT NULL
+                ORDER BY b.rider_id, b.signup_date DESC NULLS LAST
             """,
 
             'trips': """
-                DROP TABLE IF EXISTS silver.trips_base;
-                CREATE TABLE silver.trips_base AS
-                WITH cleaned AS (
-                    SELECT
-                        TRIM(trip_id::TEXT) AS trip_id,
-                        TRIM(rider_id::TEXT) AS rider_id,
-                        TRIM(driver_id::TEXT) AS driver_id,
-                        TRIM(vehicle_id::TEXT) AS vehicle_id,
-                        NULLIF(TRIM(request_ts::TEXT),'')::TIMESTAMP AS request_ts,
-                        NULLIF(TRIM(pickup_ts::TEXT),'')::TIMESTAMP AS pickup_ts,
-                        NULLIF(TRIM(dropoff_ts::TEXT),'')::TIMESTAMP AS dropoff_ts,
-                        TRIM(pickup_location::TEXT) AS pickup_location,
-                        TRIM(drop_location::TEXT) AS drop_location,
-                        NULLIF(distance_km::TEXT,'')::NUMERIC AS distance_km,
-                        NULLIF(duration_min::TEXT,'')::NUMERIC AS duration_min,
-                        NULLIF(wait_time_minutes::TEXT,'')::NUMERIC AS wait_time_minutes,
-                        NULLIF(surge_multiplier::TEXT,'')::NUMERIC AS surge_multiplier,
-                        NULLIF(base_fare_usd::TEXT,'')::NUMERIC AS base_fare_usd,
-                        NULLIF(tax_usd::TEXT,'')::NUMERIC AS tax_usd,
-                        NULLIF(tip_usd::TEXT,'')::NUMERIC AS tip_usd,
-                        NULLIF(total_fare_usd::TEXT,'')::NUMERIC AS total_fare_usd,
-                        INITCAP(TRIM(status::TEXT)) AS status,
-                        ROW_NUMBER() OVER (PARTITION BY trip_id ORDER BY request_ts DESC NULLS LAST) AS rn
-                    FROM bronze.trips
-                    WHERE trip_id IS NOT NULL
-                      AND rider_id IS NOT NULL
-                      AND driver_id IS NOT NULL
-                      AND vehicle_id IS NOT NULL
-                )
-                SELECT trip_id, rider_id, driver_id, vehicle_id, request_ts, pickup_ts, dropoff_ts,
-                       pickup_location, drop_location, distance_km, duration_min, wait_time_minutes,
-                       surge_multiplier, base_fare_usd, tax_usd, tip_usd, total_fare_usd, status
-                FROM cleaned WHERE rn = 1;
+                SELECT DISTINCT ON (b.trip_id)
+                    TRIM(trip_id::TEXT) AS trip_id,
+                    TRIM(rider_id::TEXT) AS rider_id,
+                    TRIM(driver_id::TEXT) AS driver_id,
+                    TRIM(vehicle_id::TEXT) AS vehicle_id,
+                    NULLIF(TRIM(request_ts::TEXT),'')::TIMESTAMP AS request_ts,
+                    NULLIF(TRIM(pickup_ts::TEXT),'')::TIMESTAMP AS pickup_ts,
+                    NULLIF(TRIM(dropoff_ts::TEXT),'')::TIMESTAMP AS dropoff_ts,
+                    TRIM(pickup_location::TEXT) AS pickup_location,
+                    TRIM(drop_location::TEXT) AS drop_location,
+                    NULLIF(distance_km::TEXT,'')::NUMERIC AS distance_km,
+                    NULLIF(duration_min::TEXT,'')::NUMERIC AS duration_min,
+                    NULLIF(wait_time_minutes::TEXT,'')::NUMERIC AS wait_time_minutes,
+                    NULLIF(surge_multiplier::TEXT,'')::NUMERIC AS surge_multiplier,
+                    NULLIF(base_fare_usd::TEXT,'')::NUMERIC AS base_fare_usd,
+                    NULLIF(tax_usd::TEXT,'')::NUMERIC AS tax_usd,
+                    NULLIF(tip_usd::TEXT,'')::NUMERIC AS tip_usd,
+                    NULLIF(total_fare_usd::TEXT,'')::NUMERIC AS total_fare_usd,
+                    INITCAP(TRIM(status::TEXT)) AS status
+                FROM bronze.trips b
+                WHERE trip_id IS NOT NULL
+                  AND rider_id IS NOT NULL
+                  AND driver_id IS NOT NULL
+                  AND vehicle_id IS NOT NULL
+                ORDER BY b.trip_id, b.request_ts DESC NULLS LAST
             """,
 
             'payments': """
-                DROP TABLE IF EXISTS silver.payments_base;
-                CREATE TABLE silver.payments_base AS
-                WITH cleaned AS (
-                    SELECT
-                        TRIM(payment_id::TEXT) AS payment_id,
-                        TRIM(trip_id::TEXT) AS trip_id,
-                        NULLIF(TRIM(payment_date::TEXT),'')::DATE AS payment_date,
-                        CASE
-                            WHEN LOWER(TRIM(payment_method::TEXT)) IN ('card','credit','credit card','debit','debit card') THEN 'Card'
-                            WHEN LOWER(TRIM(payment_method::TEXT)) IN ('cash') THEN 'Cash'
-                            WHEN LOWER(TRIM(payment_method::TEXT)) IN ('wallet','paytm','phonepe','gpay','stripe wallet') THEN 'Wallet'
-                            WHEN LOWER(TRIM(payment_method::TEXT)) IN ('upi','u.p.i','upi id') THEN 'UPI'
-                            ELSE INITCAP(TRIM(payment_method::TEXT))
-                        END AS payment_method,
-                        NULLIF(amount_usd::TEXT,'')::NUMERIC AS amount_usd,
-                        NULLIF(tip_usd::TEXT,'')::NUMERIC AS tip_usd,
-                        INITCAP(TRIM(status::TEXT)) AS status,
-                        TRIM(auth_code::TEXT) AS auth_code,
-                        ROW_NUMBER() OVER (PARTITION BY payment_id ORDER BY payment_date DESC NULLS LAST) AS rn
-                    FROM bronze.payments
-                    WHERE payment_id IS NOT NULL
-                      AND trip_id IS NOT NULL
-                      AND payment_date IS NOT NULL
-                      AND payment_method IS NOT NULL
-                      AND amount_usd IS NOT NULL
-                )
-                SELECT payment_id, trip_id, payment_date, payment_method, amount_usd, tip_usd, status, auth_code
-                FROM cleaned WHERE rn = 1;
+                SELECT DISTINCT ON (b.payment_id)
+                    TRIM(payment_id::TEXT) AS payment_id,
+                    TRIM(trip_id::TEXT) AS trip_id,
+                    NULLIF(TRIM(payment_date::TEXT),'')::DATE AS payment_date,
+                    CASE
+                        WHEN LOWER(TRIM(payment_method::TEXT)) IN ('card','credit','credit card','debit','debit card') THEN 'Card'
+                        WHEN LOWER(TRIM(payment_method::TEXT)) IN ('cash') THEN 'Cash'
+                        WHEN LOWER(TRIM(payment_method::TEXT)) IN ('wallet','paytm','phonepe','gpay','stripe wallet') THEN 'Wallet'
+                        WHEN LOWER(TRIM(payment_method::TEXT)) IN ('upi','u.p.i','upi id') THEN 'UPI'
+                        ELSE INITCAP(TRIM(payment_method::TEXT))
+                    END AS payment_method,
+                    NULLIF(amount_usd::TEXT,'')::NUMERIC AS amount_usd,
+                    NULLIF(tip_usd::TEXT,'')::NUMERIC AS tip_usd,
+                    INITCAP(TRIM(status::TEXT)) AS status,
+                    TRIM(auth_code::TEXT) AS auth_code
+                FROM bronze.payments b
+                WHERE payment_id IS NOT NULL
+                  AND trip_id IS NOT NULL
+                  AND payment_date IS NOT NULL
+                  AND payment_method IS NOT NULL
+                  AND amount_usd IS NOT NULL
+                ORDER BY b.payment_id, b.payment_date DESC NULLS LAST
             """
         }
 
+    @property
+    def fused_base_tables(self) -> bool:
+        """True when validation reads bronze directly and no _base tables are built."""
+        return self.pushdown_validation and self.fuse_base_tables
+
+    def base_table_steps(self) -> list[tuple[Optional[str], str]]:
+        """The _base rebuild transaction as (table the statement builds, or None; SQL) steps."""
+        if self.fused_base_tables:
+            return []
+        # Losing this commit on a crash only means re-running the step
+        return ([(None, "SET LOCAL synchronous_commit = off;")]
+                + list(self.base_table_scripts().items())
+                + [(None, self.analyze_base_tables_sql())])
+
+    def create_silver_base_tables_sql(self) -> list[str]:
+        """All _base scripts, to run inside one transaction."""
+        return [sql for _, sql in self.base_table_steps()]
+
+    def analyze_base_tables_sql(self) -> str:
+        """Fresh planner stats for the rebuilt _base tables (CTAS leaves none until autovacuum)."""
+        return "ANALYZE " + ", ".join(f"silver.{t}_base" for t in self.tables) + ";"
+
+    def create_silver_base_tables(self) -> bool:
+        if self.fused_base_tables:
+            logger.info("Skipping Silver base tables (cleaning is fused into validation)")
+            return True
+        logger.info("Creating Silver base tables with light cleaning...")
+        counts: dict[str, int] = {}
+        try:
+            # One connection, one transaction (one commit) for all five rebuilds
+            with snapshot_engine.begin() as conn:
+                for t, sql in self.base_table_steps():
+                    if t is None:
+                        conn.exec_driver_sql(sql)
+                        continue
+                    logger.info(f"Creating silver.{t}_base ...")
+                    # rowcount of the trailing CREATE TABLE AS = rows in the new table
+                    counts[t] = conn.exec_driver_sql(sql).rowcount
+                self.snapshot_bronze_fps(conn)
+        except Exception as e:
+            logger.error(f"❌ Error creating Silver base tables: {e}")
+            return False
+        return self.record_base_tables(counts)
+
+    def snapshot_bronze_fps(self, conn):
+        """Fingerprint bronze inside the REPEATABLE READ transaction that rebuilt the
+        _base tables, so the fingerprints describe exactly the rows they were built from.
+
+        Runs under a savepoint: a failure keeps the rebuild and only disables the
+        unchanged-table skip (every table is validated, none is recorded).
+        """
+        if self.fused_base_tables:
+            return
+        objs = [f"bronze.{t}" for t in self.tables]
+        try:
+            with conn.begin_nested():
+                fps = self._scan_fingerprints(conn, objs)
+        except Exception as e:
+            logger.warning(f"⚠️  Bronze fingerprinting failed, validating all tables: {e}")
+            fps = {}
+        self._bronze_fps = {t: fps.get(f"bronze.{t}") for t in self.tables}
+
+    def record_base_tables(self, counts: Optional[dict[str, int]] = None) -> bool:
+        """Count (unless `counts` is given), fingerprint and audit-log freshly (re)built _base tables."""
+        if self.fused_base_tables:
+            return True
         try:
-            for t, sql in sql_scripts.items():
-                logger.info(f"Creating silver.{t}_base ...")
-                run_sql(sql)
+            if counts is None:
+                counts = {}
                 with engine.connect() as conn:
-                    cnt = conn.execute(text(f"SELECT COUNT(*) FROM silver.{t}_base")).scalar_one()
+                    for t in self.tables:
+                        counts[t] = conn.execute(text(f"SELECT COUNT(*) FROM silver.{t}_base")).scalar_one()
+            for t, cnt in counts.items():
+                self._forget_fingerprint(f"silver.{t}_base")
                 logger.info(f" silver.{t}_base created with {cnt:,} rows")
+
+            # Fingerprint all non-empty tables in one query; log_etl_step then hits the cache
+            self._fingerprint_tables([t for t, cnt in counts.items() if cnt])
+            for t, cnt in counts.items():
                 self.log_etl_step(f"create_base_{t}", t, None, cnt, 0)
             logger.info("All Silver base tables created")
             return True
@@ -328,197 +755,278 @@ class SilverBuilder:
     # ---------------- Step 3: Deep validation (Pandas) ----------------
     def deep_validation(self) -> bool:
         logger.info("Performing deep validation...")
-        ok = True
-        # order matters only if you have real FK constraints on silver.* tables.
-        # In this version we only *check* FKs, we don't enforce constraints.
-        for t in self.tables:
-            logger.info(f"Validating {t}...")
-            if not self._validate_table(t):
-                ok = False
+        # Tables are independent here (FKs are only *checked* later, in the DQ step),
+        # so they are validated concurrently; DB I/O and pandas/NumPy work release the GIL.
+        workers = max(1, min(self.validation_workers, len(self.tables_to_validate)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate") as pool:
+            results = list(pool.map(self._validate_table, self.tables_to_validate))
+        # A validated table was reloaded together with its indexes/constraints (one transaction)
+        for t, table_ok in zip(self.tables_to_validate, results):
+            if table_ok:
+                self._record_run_metadata(t)
+        ok = all(results)
         if ok:
             logger.info("All tables passed deep validation")
         else:
             logger.warning("⚠️  Some tables had validation issues")
         return ok
 
+    def _set_stats(self, table_name: str, input_rows: int, valid_rows: int, invalid_rows: int):
+        with self._stats_lock:
+            self.stats[table_name] = {
+                'input_rows': input_rows,
+                'valid_rows': valid_rows,
+                'invalid_rows': invalid_rows
+            }
+
     def _validate_table(self, table_name: str) -> bool:
+        logger.info(f"Validating {table_name}...")
+        if self.pushdown_validation:
+            return self._validate_table_sql(table_name)
         try:
-            df = pd.read_sql(f"SELECT * FROM silver.{table_name}_base", engine)
-            logger.info(f"Loaded {len(df):,} rows for validation: silver.{table_name}_base")
-
-            if df.empty:
-                self.stats[table_name] = {'input_rows': 0, 'valid_rows': 0, 'invalid_rows': 0}
+            input_rows = valid_rows = invalid_rows = 0
+            # Validate and load chunk by chunk so memory stays bounded by read_chunksize;
+            # all chunks' writes share one transaction, committed once after the last chunk
+            with engine.begin() as conn:
+                # The reload drops the table's indexes/constraints; they are rebuilt below,
+                # in this same transaction, so a failure keeps the old table intact
+                table_ddl = self._table_ddl(conn, table_name)
+                # Column types come from the whole _base table, not from whichever rows
+                # (and NULLs) happen to land in the first chunk
+                conn.exec_driver_sql(
+                    f"DROP TABLE IF EXISTS silver.{table_name}; "
+                    f"CREATE TABLE silver.{table_name} (LIKE silver.{table_name}_base)"
+                )
+                for df in read_sql_chunks(f"SELECT * FROM silver.{table_name}_base", self.read_chunksize):
+                    input_rows += len(df)
+                    valid_df, invalid_df, reasons = self._apply_table_validations(table_name, df)
+
+                    # Append valid rows to the final silver table
+                    if not valid_df.empty:
+                        valid_df.to_sql(
+                            table_name,
+                            conn,
+                            schema='silver',
+                            if_exists='append',
+                            index=False,
+                            chunksize=self.to_sql_chunksize,
+                            method=self.to_sql_method
+                        )
+                        valid_rows += len(valid_df)
+
+                    # Save invalid rows to audit
+                    if not invalid_df.empty:
+                        self._save_rejected_rows(conn, table_name, invalid_df, reasons)
+                        invalid_rows += len(invalid_df)
+
+                self._rebuild_table_ddl(conn, table_name, table_ddl)
+
+            self._forget_fingerprint(f"silver.{table_name}")
+
+            logger.info(f"Loaded {input_rows:,} rows for validation: silver.{table_name}_base")
+            if input_rows == 0:
+                self._set_stats(table_name, 0, 0, 0)
                 logger.warning(f"No data found in silver.{table_name}_base")
                 return True
 
-            valid_df, invalid_df, reasons = self._apply_table_validations(table_name, df)
-
-            # Write valid rows to final silver table
-            if not valid_df.empty:
-                valid_df.to_sql(
-                    table_name,
-                    engine,
-                    schema='silver',
-                    if_exists='replace',
-                    index=False,
-                    chunksize=self.to_sql_chunksize,
-                    method=self.to_sql_method
-                )
-                logger.info(f"✅ {len(valid_df):,} valid rows saved to silver.{table_name}")
+            if valid_rows:
+                logger.info(f"✅ {valid_rows:,} valid rows saved to silver.{table_name}")
             else:
                 logger.warning(f"⚠️ No valid rows to write for {table_name}")
+            if invalid_rows:
+                logger.warning(f"⚠️  {invalid_rows:,} invalid rows saved to audit.rejected_rows")
 
-            # Save invalid rows to audit
-            if not invalid_df.empty:
-                self._save_rejected_rows(table_name, invalid_df, reasons)
-                logger.warning(f"⚠️  {len(invalid_df):,} invalid rows saved to audit.rejected_rows")
-
-            self.stats[table_name] = {
-                'input_rows': len(df),
-                'valid_rows': len(valid_df),
-                'invalid_rows': len(invalid_df)
-            }
+            self._set_stats(table_name, input_rows, valid_rows, invalid_rows)
 
             self.log_etl_step(
                 f"deep_validation_{table_name}",
                 table_name,
-                len(df),
-                int(self.stats[table_name]['valid_rows']),
-                int(self.stats[table_name]['invalid_rows'])
+                input_rows,
+                valid_rows,
+                invalid_rows
             )
             return True
         except Exception as e:
             logger.error(f"Error validating {table_name}: {e}")
             return False
 
+    def _validate_table_sql(self, table_name: str) -> bool:
+        """Validate silver.<table>_base entirely in SQL: CTAS the valid rows, INSERT ... SELECT the rejects.
+
+        With fuse_base_tables the cleaning query feeds validation directly (one
+        MATERIALIZED CTE) and silver.<table>_base is never written.
+        """
+        checks = [(f"COALESCE(({bad}), FALSE)", reason) for bad, reason in SQL_VALIDATORS[table_name]()]
+        any_bad = " OR ".join(bad for bad, _ in checks)
+        reason_expr = "CONCAT_WS('; ', " + ", ".join(
+            f"CASE WHEN {bad} THEN '{reason}' END" for bad, reason in checks
+        ) + ")"
+        params = {
+            "email_re": EMAIL_PATTERN,
+            "plate_re": PLATE_PATTERN,
+            "max_year": datetime.now().year + 1,
+            "methods": sorted(ALLOWED_PAYMENT_METHODS),
+        }
+        try:
+            with (snapshot_engine if self.fused_base_tables else engine).begin() as conn:
+                table_ddl = self._table_ddl(conn, table_name)
+                if self.fused_base_tables:
+                    # Validation reads bronze itself here: fingerprint it in the same snapshot
+                    try:
+                        with conn.begin_nested():
+                            fp = self._scan_fingerprints(conn, [f"bronze.{table_name}"])[f"bronze.{table_name}"]
+                    except Exception as e:
+                        logger.warning(f"Bronze fingerprint skipped for {table_name}: {e}")
+                        fp = None
+                    self._bronze_fps[table_name] = fp
+                conn.execute(text(f"DROP TABLE IF EXISTS silver.{table_name}"))
+                if self.fused_base_tables:
+                    # bronze -> cleaned/deduped -> valid rows + rejects in one statement, no _base table
+                    cleaned = self.base_table_selects()[table_name]
+                    conn.execute(text(f"CREATE TABLE silver.{table_name} AS SELECT * FROM ({cleaned}) b WITH NO DATA"))
+                    # Both INSERTs report their own row counts (the NULL-reason row counts the valid ones)
+                    counts = conn.execute(text(f"""
+                        WITH b AS MATERIALIZED ({cleaned}),
+                        rejected AS (
+                            INSERT INTO audit.rejected_rows (table_name, record, reason, run_id)
+                            SELECT :t, to_jsonb(b), {reason_expr}, :run FROM b WHERE {any_bad}
+                            RETURNING reason
+                        ),
+                        valid AS (
+                            INSERT INTO silver.{table_name} SELECT * FROM b WHERE NOT ({any_bad})
+                            RETURNING 1
+                        )
+                        SELECT CAST(NULL AS TEXT), COUNT(*) FROM valid
+                        UNION ALL
+                        SELECT reason, COUNT(*) FROM rejected GROUP BY reason
+                    """), {**params, "t": table_name, "run": self.run_id}).all()
+                    valid_rows = next(count for reason, count in counts if reason is None)
+                    reason_counts = [(reason, count) for reason, count in counts if reason is not None]
+                else:
+                    valid_rows = conn.execute(text(f"""
+                        CREATE TABLE silver.{table_name} AS
+                        SELECT * FROM silver.{table_name}_base WHERE NOT ({any_bad})
+                    """), params).rowcount
+                    # Counted from the INSERT's own RETURNING rows, not re-read by run_id
+                    reason_counts = conn.execute(text(f"""
+                        WITH rejected AS (
+                            INSERT INTO audit.rejected_rows (table_name, record, reason, run_id)
+                            SELECT :t, to_jsonb(b), {reason_expr}, :run
+                            FROM silver.{table_name}_base b WHERE {any_bad}
+                            RETURNING reason
+                        )
+                        SELECT reason, COUNT(*) FROM rejected GROUP BY reason
+                    """), {**params, "t": table_name, "run": self.run_id}).all()
+                self._rebuild_table_ddl(conn, table_name, table_ddl)
+            invalid_rows = sum(count for _, count in reason_counts)
+            self._forget_fingerprint(f"silver.{table_name}")
+
+            input_rows = valid_rows + invalid_rows
+            logger.info(f"✅ {valid_rows:,} valid rows saved to silver.{table_name} (validated in SQL)")
+            for reason, count in reason_counts:
+                logger.info(f"{table_name}: {count} rows rejected due to {reason}")
+
+            self._set_stats(table_name, input_rows, valid_rows, invalid_rows)
+            self.log_etl_step(f"deep_validation_{table_name}", table_name, input_rows, valid_rows, invalid_rows)
+            return True
+        except Exception as e:
+            logger.error(f"Error validating {table_name} in SQL: {e}")
+            return False
+
+    @staticmethod
+    def _table_ddl(conn, table_name: str) -> list[str]:
+        """DDL that restores silver.<table>'s indexes and constraints after a reload.
+
+        Plain indexes come from pg_indexes; primary key, unique, check and
+        exclusion constraints (which own their indexes) from pg_get_constraintdef.
+        Foreign keys are left to the DQ step. Empty when the table does not exist.
+        """
+        rows = conn.execute(text("""
+            SELECT 'ALTER TABLE silver.' || quote_ident(:t) || ' ADD CONSTRAINT '
+                   || quote_ident(c.conname) || ' ' || pg_get_constraintdef(c.oid)
+            FROM pg_constraint c
+            WHERE c.conrelid = to_regclass('silver.' || quote_ident(:t))
+              AND c.contype IN ('p', 'u', 'c', 'x')
+            UNION ALL
+            SELECT i.indexdef FROM pg_indexes i
+            WHERE i.schemaname = 'silver' AND i.tablename = :t
+              AND NOT EXISTS (
+                  SELECT 1 FROM pg_constraint c
+                  WHERE c.conindid = to_regclass(quote_ident(i.schemaname) || '.' || quote_ident(i.indexname))
+              )
+        """), {"t": table_name}).scalars().all()
+        return list(rows)
+
+    def _rebuild_table_ddl(self, conn, table_name: str, ddl: list[str]):
+        """Re-create the indexes/constraints captured by _table_ddl, after the bulk load."""
+        if not ddl:
+            return
+        conn.execute(text("SELECT set_config('maintenance_work_mem', :mem, true)"),
+                     {"mem": self.index_maintenance_work_mem})
+        for stmt in ddl:
+            # No parameters, but psycopg2 still %-formats driver SQL (e.g. a LIKE '%x' check)
+            conn.exec_driver_sql(stmt.replace("%", "%%"))
+        logger.info(f"Rebuilt {len(ddl)} index(es)/constraint(s) on silver.{table_name}")
+
     def _apply_table_validations(self, table_name: str, df: pd.DataFrame):
         """Return (valid_df, invalid_df, reasons)."""
-        valid_mask = pd.Series(True, index=df.index)
-        reasons = [''] * len(df)
-
-        def add_reason(mask: pd.Series, msg: str):
-            nonlocal valid_mask, reasons
-            if mask is None or mask.empty:
-                return
-            mask = mask.reindex(df.index, fill_value=False)
-            for i, bad in mask.items():
-                if bad:
-                    reasons[i] = (reasons[i] + '; ' if reasons[i] else '') + msg
-            valid_mask &= ~mask
-
-        # ------------------- Drivers -------------------
-        if table_name == 'drivers':
-            critical_cols = ["driver_id", "driver_name", "license_number", "email"]
-            add_reason(df[critical_cols].isnull().any(axis=1), "Critical column NULL")
-
-            email_pat = r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$"
-            add_reason(~df['email'].fillna('').str.match(email_pat), 'Invalid email')
-            add_reason(~df['license_number'].notna(), 'Missing license number')
-            add_reason(~df['driver_rating'].fillna(0).between(0, 5), 'Driver rating out of range (0-5)')
-
-        # ------------------- Vehicles -------------------
-        elif table_name == 'vehicles':
-            # ⚠️ You mentioned rider_name & rider_email, but those don’t exist in vehicles schema.
-            # Probably you meant driver_name/driver_email OR just vehicle criticals.
-            # Assuming: vehicle_id, driver_id, year, plate are critical.
-            critical_cols = ["vehicle_id", "driver_id", "year", "plate"]
-            add_reason(df[critical_cols].isnull().any(axis=1), "Critical column NULL")
-
-            current_year = datetime.now().year
-            add_reason(~df['year'].fillna(0).between(1980, current_year + 1),
-                       f'Invalid year (1980-{current_year + 1})')
-            add_reason(~df['capacity'].fillna(0).between(1, 8), 'Capacity out of range (1-8)')
-            add_reason(~df['plate'].fillna('').str.match(r'^[A-Z0-9\-]{3,12}$'), 'Invalid plate')
-
-        # ------------------- Riders -------------------
-        elif table_name == 'riders':
-            critical_cols = ["rider_id", "rider_name", "email"]
-            add_reason(df[critical_cols].isnull().any(axis=1), "Critical column NULL")
-
-            email_pat = r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$"
-            add_reason(~df['email'].fillna('').str.match(email_pat), 'Invalid email')
-            add_reason(~df['rider_rating'].fillna(0).between(0, 5), 'Rider rating out of range (0-5)')
-
-        # ------------------- Trips -------------------
-        elif table_name == 'trips':
-            critical_cols = ["trip_id", "rider_id", "driver_id", "vehicle_id",
-                             "request_ts", "pickup_location", "drop_location", "total_fare_usd"]
-            add_reason(df[critical_cols].isnull().any(axis=1), "Critical column NULL")
-
-            add_reason(
-                (df['pickup_ts'].notna()) & (df['request_ts'].notna()) & (df['pickup_ts'] < df['request_ts']),
-                'pickup_ts before request_ts'
-            )
-            add_reason(
-                (df['dropoff_ts'].notna()) & (df['pickup_ts'].notna()) & (df['dropoff_ts'] < df['pickup_ts']),
-                'dropoff_ts before pickup_ts'
-            )
-            for col, label in [
-                ('distance_km', 'distance_km'),
-                ('duration_min', 'duration_min'),
-                ('wait_time_minutes', 'wait_time_minutes'),
-                ('base_fare_usd', 'base_fare_usd'),
-                ('tax_usd', 'tax_usd'),
-                ('tip_usd', 'tip_usd'),
-                ('total_fare_usd', 'total_fare_usd')
-            ]:
-                add_reason(df[col].fillna(0) < 0, f'Negative {label}')
-            if {'base_fare_usd', 'tax_usd', 'tip_usd', 'total_fare_usd'}.issubset(df.columns):
-                add_reason(
-                    (df[['base_fare_usd', 'tax_usd', 'tip_usd']].fillna(0).sum(axis=1) -
-                     df['total_fare_usd'].fillna(0)).abs() > 1e-6,
-                    'total_fare_usd != base+tax+tip'
-                )
-
-        # ------------------- Payments -------------------
-        elif table_name == 'payments':
-            critical_cols = ["payment_id", "trip_id", "payment_date", "payment_method", "amount_usd"]
-            add_reason(df[critical_cols].isnull().any(axis=1), "Critical column NULL")
+        # One boolean column per check; reason strings are only built for failing rows
+        checks = [
+            (msg, mask.reindex(df.index, fill_value=False).to_numpy(dtype=bool))
+            for mask, msg in VALIDATORS[table_name](df)
+            if mask is not None and not mask.empty
+        ]
+        if checks:
+            fail = np.column_stack([m for _, m in checks])
+            invalid = fail.any(axis=1)
+        else:
+            fail = np.zeros((len(df), 0), dtype=bool)
+            invalid = np.zeros(len(df), dtype=bool)
 
-            add_reason(df['amount_usd'].fillna(0) < 0, 'Negative amount_usd')
-            add_reason(df['tip_usd'].fillna(0) < 0, 'Negative tip_usd')
-            allowed = {'Card', 'Cash', 'Wallet', 'UPI'}
-            add_reason(~df['payment_method'].fillna('').isin(allowed), 'Unknown payment_method')
+        msgs = [msg for msg, _ in checks]
+        invalid_reasons = [
+            '; '.join(msg for msg, bad in zip(msgs, row) if bad) for row in fail[invalid]
+        ]
+        return df[~invalid].copy(), df[invalid].copy(), invalid_reasons
 
-        valid_df = df[valid_mask].copy()
-        invalid_df = df[~valid_mask].copy()
-        invalid_reasons = [reasons[i] for i in invalid_df.index]
-        return valid_df, invalid_df, invalid_reasons
+    def _save_rejected_rows(self, conn, table_name: str, invalid_df: pd.DataFrame, reasons: list[str]):
+        """COPY rejected rows into audit.rejected_rows as JSONB on the caller's
+        connection (committed with the rest of the table), and log counts per reason.
 
-    def _save_rejected_rows(self, table_name: str, invalid_df: pd.DataFrame, reasons: list[str]):
-        """Batch insert rejected rows into audit.rejected_rows as JSONB,
-        and log counts per reason.
+        Errors propagate: a failed COPY aborts the caller's transaction, which
+        must then be rolled back rather than written to.
         """
-        try:
-            if invalid_df.empty:
-                return
-
-            params = []
-            for (idx, row), reason in zip(invalid_df.iterrows(), reasons):
-                rec_dict = row.replace({pd.NA: None, np.nan: None}).to_dict()
-                rec_json = json.dumps(rec_dict, default=str)
-                params.append({
-                    "t": table_name,
-                    "r": rec_json,
-                    "reason": reason or "Validation failed",
-                    "run": self.run_id
-                })
-
-            sql = text("""
-                INSERT INTO audit.rejected_rows (table_name, record, reason, run_id)
-                VALUES (:t, CAST(:r AS JSONB), :reason, :run)
-            """)
+        if invalid_df.empty:
+            return
+
+        # to_json's iso format would turn DATE values (datetime.date objects) into
+        # midnight timestamps; keep them as 'YYYY-MM-DD' like the DATE column itself
+        date_cols = [
+            c for c in invalid_df.columns[invalid_df.dtypes == object]
+            if pd.api.types.infer_dtype(invalid_df[c], skipna=True) == "date"
+        ]
+        if date_cols:
+            invalid_df = invalid_df.assign(
+                **{c: invalid_df[c].map(date.isoformat, na_action='ignore') for c in date_cols}
+            )
 
-            with engine.begin() as conn:
-                conn.execute(sql, params)
+        # One C-level pass over the frame instead of iterrows + json.dumps per row.
+        # NaN/NA become null; control characters are escaped, so lines split cleanly.
+        json_lines = invalid_df.to_json(
+            orient='records', lines=True, date_format='iso', default_handler=str
+        ).splitlines()
+        reasons = [reason or "Validation failed" for reason in reasons]
 
-            # 🔎 Log breakdown of rejection reasons
-            reason_counts = Counter([p["reason"] for p in params])
-            for reason, count in reason_counts.items():
-                logger.info(f"{table_name}: {count} rows rejected due to {reason}")
+        # COPY straight into the JSONB column (its text input is the JSON line)
+        copy_rows(
+            conn, "audit.rejected_rows", ["table_name", "record", "reason", "run_id"],
+            ((table_name, rec_json, reason, self.run_id) for rec_json, reason in zip(json_lines, reasons))
+        )
 
-        except Exception as e:
-            logger.error(f"Error saving rejected rows for {table_name}: {e}")
+        # 🔎 Log breakdown of rejection reasons
+        reason_counts = Counter(reasons)
+        for reason, count in reason_counts.items():
+            logger.info(f"{table_name}: {count} rows rejected due to {reason}")
 
     # ---------------- Step 4: Data Quality checks ----------------
     def run_data_quality_checks(self) -> bool:
@@ -560,23 +1068,32 @@ class SilverBuilder:
             ]
         }
 
+        flat = [(t, name, sql) for t, table_checks in checks.items() for name, sql in table_checks]
+        # Every check as a scalar subquery of one UNION ALL: a single round-trip
+        batch_sql = "\nUNION ALL\n".join(f"SELECT {i} AS idx, ({sql}) AS bad" for i, (_, _, sql) in enumerate(flat))
+
         all_passed = True
         try:
             with engine.begin() as conn:
-                for table_name, table_checks in checks.items():
-                    logger.info(f"Running DQ checks for {table_name}...")
-                    for check_name, sql in table_checks:
-                        bad = conn.execute(text(sql)).scalar_one()
-                        passed = (bad == 0)
-                        if not passed:
-                            all_passed = False
-                            logger.warning(f"❌ {table_name}.{check_name}: {bad} bad rows")
-                        else:
-                            logger.info(f"✅ {table_name}.{check_name}: PASSED")
-                        conn.execute(text("""
-                            INSERT INTO audit.dq_results (table_name, check_name, pass_fail, bad_row_count, run_id)
-                            VALUES (:t, :c, :p, :b, :r)
-                        """), {"t": table_name, "c": check_name, "p": passed, "b": int(bad), "r": self.run_id})
+                bad_counts = dict(conn.execute(text(batch_sql)).all())
+                results = []
+                current = None
+                for i, (table_name, check_name, _) in enumerate(flat):
+                    if table_name != current:
+                        current = table_name
+                        logger.info(f"Running DQ checks for {table_name}...")
+                    bad = int(bad_counts[i])
+                    passed = (bad == 0)
+                    if not passed:
+                        all_passed = False
+                        logger.warning(f"❌ {table_name}.{check_name}: {bad} bad rows")
+                    else:
+                        logger.info(f"✅ {table_name}.{check_name}: PASSED")
+                    results.append({"t": table_name, "c": check_name, "p": passed, "b": bad, "r": self.run_id})
+                conn.execute(text("""
+                    INSERT INTO audit.dq_results (table_name, check_name, pass_fail, bad_row_count, run_id)
+                    VALUES (:t, :c, :p, :b, :r)
+                """), results)
         except Exception as e:
             logger.error(f"Error running DQ checks: {e}")
             return False
@@ -589,20 +1106,18 @@ class SilverBuilder:
 
     # ---------------- Audit logging helpers ----------------
     def log_etl_step(self, step_name, table_name, input_count, output_count, rejected_count):
-        checksum = None
+        checksum = None  # None = unknown (checksum failed); EMPTY_FINGERPRINT = known empty
         try:
-            if output_count and output_count > 0:
+            if output_count == 0:
+                checksum = EMPTY_FINGERPRINT
+            elif output_count:
                 checksum = self._calculate_checksum(table_name)
         except Exception as e:
             logger.warning(f"Checksum skipped for {table_name}: {e}")
 
-        try:
-            run_sql("""
-                INSERT INTO audit.etl_log
-                (run_id, run_timestamp, step_executed, table_name, input_row_count,
-                 output_row_count, rejected_row_count, data_checksum)
-                VALUES (:run_id, :ts, :step, :table, :in_c, :out_c, :rej_c, :chk)
-            """, {
+        # Buffered; written by flush_etl_log() in one executemany at the end of the run
+        with self._etl_log_lock:
+            self._etl_log_buf.append({
                 "run_id": self.run_id,
                 "ts": datetime.now(),
                 "step": step_name,
@@ -612,67 +1127,299 @@ class SilverBuilder:
                 "rej_c": int(rejected_count) if rejected_count is not None else None,
                 "chk": checksum
             })
+
+    def flush_etl_log(self):
+        """Write all buffered audit.etl_log rows on one connection, in one transaction."""
+        with self._etl_log_lock:
+            rows, self._etl_log_buf = self._etl_log_buf, []
+        try:
+            run_sql_many(ETL_LOG_INSERT, rows)
         except Exception as e:
-            logger.error(f"Error logging ETL step ({table_name} - {step_name}): {e}")
+            logger.error(f"Error logging {len(rows)} ETL steps: {e}")
 
     def _calculate_checksum(self, table_name: str) -> Optional[str]:
-        """Return md5 over first 1000 JSON rows of silver.<table> (or <table>_base if final missing)."""
+        """Return a '<row_count>:<md5>' fingerprint over all rows of silver.<table>
+        (or <table>_base if final missing)."""
+        return self._fingerprint_tables([table_name]).get(table_name)
+
+    @staticmethod
+    def _fingerprint_sql(obj: str, columns: list[str]) -> str:
+        """Scalar SELECT returning one row of per-column aggregates for one table/object.
+
+        Column-wise instead of hashing each serialized row: every column gets an
+        order-independent SUM of 64-bit hashtextextended over "<key><US><value>"
+        (key = first column), so values stay bound to their row without building
+        a record text per row. The aggregates are folded client-side with MD5.
+        """
+        q = engine.dialect.identifier_preparer.quote
+        key = q(columns[0])
+        col_sums = ", ".join(FP_COLUMN_TEMPLATE.format(key=key, col=q(c)) for c in columns[1:])
+        table = ".".join(q(part) for part in obj.split("."))
+        return FP_TEMPLATE.format(col_sums=col_sums or "''", table=table)
+
+    @staticmethod
+    def _fold_fingerprint(aggregates: Optional[str]) -> Optional[str]:
+        """Turn '<count>,<col sums...>' into '<count>:<md5 of the aggregates>'."""
+        if aggregates is None:
+            return None
+        count = aggregates.split(',', 1)[0]
+        if count == '0':
+            return EMPTY_FINGERPRINT
+        return f"{count}:{hashlib.md5(aggregates.encode()).hexdigest()}"
+
+    @staticmethod
+    def _fp_digest(fingerprint: Optional[str]) -> Optional[bytes]:
+        """16-byte MD5 of a fingerprint string: the form persisted and compared in silver.run_metadata."""
+        if fingerprint is None:
+            return None
+        return hashlib.md5(fingerprint.encode()).digest()
+
+    def _fingerprint_tables(self, tables: list[str]) -> dict[str, Optional[str]]:
+        """Fingerprint silver.<table> (or <table>_base if final missing) for several tables."""
+        if not tables:
+            return {}
         with engine.connect() as conn:
-            exists = conn.execute(
-                text("SELECT to_regclass(:tbl) IS NOT NULL"),
-                {"tbl": f"silver.{table_name}"}
-            ).scalar_one()
-            obj = f"silver.{table_name}" if exists else f"silver.{table_name}_base"
-
-            res = conn.execute(text(f"""
-                SELECT MD5(STRING_AGG(md5_row, '' ORDER BY md5_row)) AS md5
-                FROM (
-                    SELECT MD5(CAST(ROW_TO_JSON(t.*) AS TEXT)) AS md5_row
-                    FROM (SELECT * FROM {obj} LIMIT 1000) t
-                ) s
-            """)).scalar_one()
-            return res
+            rows = conn.execute(
+                text("SELECT t, to_regclass('silver.' || t) IS NOT NULL "
+                     "FROM unnest(CAST(:tables AS TEXT[])) AS t"),
+                {"tables": list(tables)}
+            ).all()
+        objs = {t: f"silver.{t}" if exists else f"silver.{t}_base" for t, exists in rows}
+        fps = self._fingerprint_objects([objs[t] for t in tables])
+        return {t: fps[objs[t]] for t in tables}
+
+    def _fingerprint_objects(self, objs: list[str]) -> dict[str, Optional[str]]:
+        """Fingerprint several objects in a single round-trip (UNION ALL of scalar subqueries).
+
+        The scan runs in its own read-only transaction. Fingerprints are cached
+        per object for the run (invalidated when the object is rewritten).
+        """
+        with self._fingerprint_lock:
+            known = {o: self._fingerprint_cache[o] for o in objs if o in self._fingerprint_cache}
+        missing = [o for o in objs if o not in known]
+        if missing:
+            try:
+                with engine.begin() as conn:
+                    conn.exec_driver_sql("SET TRANSACTION READ ONLY; SET LOCAL application_name = 'silver_fp'")
+                    computed = self._scan_fingerprints(conn, missing)
+            except ProgrammingError as e:
+                # 42883 undefined_function: server without hashtextextended (PG < 11)
+                if getattr(e.orig, "pgcode", None) != "42883":
+                    raise
+                logger.warning("hashtextextended unavailable; fingerprinting client-side")
+                computed = {o: self._fingerprint_client_side(o) for o in missing}
+            with self._fingerprint_lock:
+                self._fingerprint_cache.update(computed)
+            known.update(computed)
+
+        return {o: known[o] for o in objs}
+
+    def _forget_fingerprint(self, obj: str):
+        """Drop the memoized fingerprint of an object that was just rewritten."""
+        with self._fingerprint_lock:
+            self._fingerprint_cache.pop(obj, None)
+
+    @staticmethod
+    def _fingerprint_client_side(obj: str, batch_rows: int = 10000) -> str:
+        """Fallback fingerprint: stream rows (in a stable order) and MD5 them client-side.
+
+        Rows arrive through a server-side cursor as text and are hashed one
+        joined batch at a time, so hashlib's C loop does the work instead of a
+        per-row Python update. Same '<count>:<md5>' shape as the server-side
+        fingerprint, but not the same value.
+        """
+        q = engine.dialect.identifier_preparer.quote
+        table = ".".join(q(part) for part in obj.split("."))
+        digest, count = hashlib.md5(), 0
+        with engine.begin() as conn:
+            conn.exec_driver_sql("SET TRANSACTION READ ONLY; SET LOCAL application_name = 'silver_fp'")
+            result = conn.exec_driver_sql(
+                f'SELECT t::TEXT FROM {table} t ORDER BY t::TEXT COLLATE "C"',
+                execution_options={"stream_results": True, "max_row_buffer": batch_rows},
+            )
+            for batch in result.partitions(batch_rows):
+                count += len(batch)
+                digest.update(("\n".join(row[0] for row in batch) + "\n").encode())
+        return EMPTY_FINGERPRINT if count == 0 else f"{count}:{digest.hexdigest()}"
+
+    def _scan_fingerprints(self, conn, objs: list[str]) -> dict[str, Optional[str]]:
+        """Run the (memoized) UNION ALL fingerprint query for `objs` on `conn`."""
+        unknown = [o for o in objs if o not in self._fp_sql]
+        if unknown:
+            # One catalog query for every object we have not introspected yet
+            cols = conn.execute(text("""
+                SELECT table_schema || '.' || table_name,
+                       ARRAY_AGG(column_name::TEXT ORDER BY ordinal_position)
+                FROM information_schema.columns
+                WHERE table_schema || '.' || table_name = ANY(CAST(:objs AS TEXT[]))
+                GROUP BY 1
+            """), {"objs": unknown}).all()
+            for obj, columns in cols:
+                self._fp_sql[obj] = self._fingerprint_sql(obj, columns)
+        key = tuple(objs)
+        stmt = self._fp_stmts.get(key)
+        if stmt is None:
+            # Rows are labelled by position so no object name is spliced in as a literal
+            stmt = self._fp_stmts[key] = text("\nUNION ALL\n".join(
+                f"SELECT {i} AS idx, ({self._fp_sql[obj]}) AS fp" for i, obj in enumerate(key)
+            ))
+        return {key[i]: self._fold_fingerprint(agg) for i, agg in conn.execute(stmt)}
+
+    # ---------------- Incremental re-validation ----------------
+    def _rules_fp(self, table_name: str) -> bytes:
+        """16-byte MD5 of everything besides bronze that shapes silver.<table>.
+
+        Covers the _base cleaning script, both validator sources, the shared
+        patterns, the current year (the vehicles year bound moves with it) and
+        the validation mode, so a rules change re-validates the table.
+        """
+        parts = [
+            self.base_table_scripts()[table_name],
+            inspect.getsource(VALIDATORS[table_name]),
+            inspect.getsource(SQL_VALIDATORS[table_name]),
+            EMAIL_PATTERN, PLATE_PATTERN, ",".join(sorted(ALLOWED_PAYMENT_METHODS)),
+            ",".join(TRIP_NUMERIC_COLS),
+            str(datetime.now().year),
+            f"pushdown={self.pushdown_validation}",
+        ]
+        return hashlib.md5("\x1f".join(parts).encode()).digest()
+
+    def select_changed_tables(self, force: bool = False) -> list[str]:
+        """Restrict deep validation to tables whose bronze source changed.
+
+        A table is skipped when its bronze fingerprint and rules version
+        (_rules_fp) both equal the ones recorded in silver.run_metadata by the
+        last successful validation and the final silver.<table> still exists.
+        `force=True` re-validates everything. DQ checks still run on all tables,
+        since the FK checks span tables.
+
+        Skipped tables carry over the counts logged by the run that validated
+        them. This is only an optimization: on any error every table is validated.
+        """
+        self.tables_to_validate = list(self.tables)
+        try:
+            if not self._bronze_fps:
+                # No _base rebuild took them (fused mode): decide on a fresh scan; each table's
+                # validation transaction then re-fingerprints the bronze rows it actually read
+                fps = self._fingerprint_objects([f"bronze.{t}" for t in self.tables])
+                self._bronze_fps = {t: fps[f"bronze.{t}"] for t in self.tables}
+            if force:
+                return self.tables_to_validate
+            with engine.connect() as conn:
+                # Latest validation per table, with the counts that run logged for it
+                last = {row.table_name: row for row in conn.execute(text("""
+                    SELECT m.table_name, m.bronze_fp, m.rules_fp, m.run_id,
+                           l.input_row_count, l.output_row_count, l.rejected_row_count
+                    FROM (
+                        SELECT DISTINCT ON (table_name) table_name, bronze_fp, rules_fp, run_id
+                        FROM silver.run_metadata
+                        WHERE table_name = ANY(CAST(:tables AS TEXT[]))
+                          AND to_regclass('silver.' || table_name) IS NOT NULL
+                        ORDER BY table_name, created_at DESC
+                    ) m
+                    JOIN LATERAL (
+                        SELECT input_row_count, output_row_count, rejected_row_count
+                        FROM audit.etl_log
+                        WHERE run_id = m.run_id AND step_executed = 'deep_validation_' || m.table_name
+                        ORDER BY id DESC LIMIT 1
+                    ) l ON TRUE
+                """), {"tables": self.tables})}
+        except Exception as e:
+            logger.warning(f"⚠️  Change detection failed, validating all tables: {e}")
+            return self.tables_to_validate
+
+        unchanged = {
+            t: last[t] for t in self.tables
+            if t in last and self._bronze_fps[t] is not None
+            and bytes(last[t].bronze_fp) == self._fp_digest(self._bronze_fps[t])
+            and last[t].rules_fp is not None and bytes(last[t].rules_fp) == self._rules_fp(t)
+        }
+        self.tables_to_validate = [t for t in self.tables if t not in unchanged]
+        for t, prev in unchanged.items():
+            logger.info(f"⏭️  {t}: bronze and rules unchanged since run {prev.run_id}, skipping deep validation")
+            self._set_stats(t, prev.input_row_count or 0, prev.output_row_count or 0, prev.rejected_row_count or 0)
+            self.log_etl_step(f"deep_validation_{t}", t, prev.input_row_count,
+                              prev.output_row_count, prev.rejected_row_count)
+        return self.tables_to_validate
+
+    def _record_run_metadata(self, table_name: str):
+        """Remember which bronze snapshot and rules version produced the current silver.<table>."""
+        bronze_fp = self._bronze_fps.get(table_name)
+        if bronze_fp is None:
+            return
+        try:
+            silver_fp = self._calculate_checksum(table_name)
+            run_sql("""
+                INSERT INTO silver.run_metadata (table_name, bronze_fp, silver_fp, rules_fp, run_id)
+                VALUES (:t, :b, :s, :v, :r)
+            """, {"t": table_name, "b": self._fp_digest(bronze_fp), "s": self._fp_digest(silver_fp),
+                  "v": self._rules_fp(table_name), "r": self.run_id})
+        except Exception as e:
+            logger.warning(f"Run metadata skipped for {table_name}: {e}")
 
     # ---------------- Final summary ----------------
     def log_summary(self):
-        logger.info("=" * 60)
-        logger.info("📊 SILVER LAYER PROCESSING SUMMARY")
-        logger.info("=" * 60)
-
-        total_input = sum(stats.get('input_rows', 0) for stats in self.stats.values())
-        total_valid = sum(stats.get('valid_rows', 0) for stats in self.stats.values())
-        total_invalid = sum(stats.get('invalid_rows', 0) for stats in self.stats.values())
-
-        for table_name in self.tables:
-            stats = self.stats.get(table_name, {})
-            input_rows = stats.get('input_rows', 0)
-            valid_rows = stats.get('valid_rows', 0)
-            invalid_rows = stats.get('invalid_rows', 0)
-            logger.info(f"  {table_name:<10}: {input_rows:>8,} → {valid_rows:>8,} valid, {invalid_rows:>6,} rejected")
-
-        logger.info("-" * 60)
-        logger.info(f"  {'TOTAL':<10}: {total_input:>8,} → {total_valid:>8,} valid, {total_invalid:>6,} rejected")
-        logger.info(f"  Run ID: {self.run_id}")
-        logger.info("=" * 60)
+        # Per-table counts as one (n_tables, 3) int64 array; totals are a single column-wise reduction
+        counts = np.fromiter(
+            (self.stats.get(t, {}).get(k, 0) for t in self.tables for k in ('input_rows', 'valid_rows', 'invalid_rows')),
+            dtype=np.int64, count=3 * len(self.tables)
+        ).reshape(-1, 3)
+        total_input, total_valid, total_invalid = counts.sum(axis=0).tolist()
+
+        lines = ["=" * 60, "📊 SILVER LAYER PROCESSING SUMMARY", "=" * 60]
+        for table_name, (input_rows, valid_rows, invalid_rows) in zip(self.tables, counts.tolist()):
+            skipped = "  (unchanged, not revalidated)" if table_name not in self.tables_to_validate else ""
+            lines.append(f"  {table_name:<10}: {input_rows:>8,} → {valid_rows:>8,} valid, {invalid_rows:>6,} rejected{skipped}")
+
+        lines += [
+            "-" * 60,
+            f"  {'TOTAL':<10}: {total_input:>8,} → {total_valid:>8,} valid, {total_invalid:>6,} rejected",
+            f"  Run ID: {self.run_id}",
+            "=" * 60,
+        ]
+        logger.info("\n".join(lines))
 
 
 # ---------------- Orchestration ----------------
 def main():
-    logger.info("🥈 MEDALLION SILVER LAYER - BUILDER STARTED")
+    import argparse
 
-    sb = SilverBuilder()
+    parser = argparse.ArgumentParser(description="Medallion Silver Layer builder")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-validate every table (disables the unchanged-table skip)",
+    )
+    args = parser.parse_args()
 
-    if not sb.setup_schemas():
-        raise SystemExit(1)
+    with queued_logging():
+        logger.info("🥈 MEDALLION SILVER LAYER - BUILDER STARTED")
 
-    if not sb.create_silver_base_tables():
-        raise SystemExit(1)
+        sb = SilverBuilder()
+
+        # Schema bootstrap + every _base CTAS in one transaction and one round-trip;
+        # bronze is fingerprinted in that same snapshot
+        logger.info("Setting up schemas and creating Silver base tables...")
+        try:
+            with snapshot_engine.begin() as conn:
+                conn.exec_driver_sql("\n".join(sb.setup_schemas_sql() + sb.create_silver_base_tables_sql()))
+                sb.snapshot_bronze_fps(conn)
+        except Exception as e:
+            logger.error(f"❌ Error setting up schemas / Silver base tables: {e}")
+            raise SystemExit(1)
+
+        try:
+            if not sb.record_base_tables():
+                raise SystemExit(1)
 
-    sb.deep_validation()
-    sb.run_data_quality_checks()
-    sb.log_summary()
+            sb.select_changed_tables(force=args.force)
+            sb.deep_validation()
+            sb.run_data_quality_checks()
+            sb.log_summary()
+        finally:
+            sb.flush_etl_log()
 
-    logger.info("🎉 Silver build completed")
+        logger.info("🎉 Silver build completed")
 
 
 if __name__ == "__main__":
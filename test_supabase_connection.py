@@ -1,4 +1,6 @@
 import os
+import statistics
+from time import perf_counter_ns
 from dotenv import load_dotenv
 import psycopg2
 
@@ -7,7 +9,10 @@ load_dotenv()
 
 # Read env vars
 host = os.getenv("SUPABASE_HOST")
-port = os.getenv("SUPABASE_PORT")
+# Short-lived check: prefer the Supavisor transaction-mode pooler (6543) so no
+# backend is started for it; long-running bulk work (gold's Supabase push)
+# stays on the session port in SUPABASE_PORT.
+port = os.getenv("SUPABASE_POOLER_PORT") or os.getenv("SUPABASE_PORT")
 dbname = os.getenv("SUPABASE_DB")
 user = os.getenv("SUPABASE_USER")
 password = os.getenv("SUPABASE_PASSWORD")
@@ -24,6 +29,19 @@ try:
         password=password  # passing password separately avoids URL parsing issues
     )
     print("✅ Connection successful!")
+
+    # Round-trip latency baseline: 100 x SELECT 1 on the open connection
+    times = []
+    cur = conn.cursor()
+    for _ in range(100):
+        t = perf_counter_ns()
+        cur.execute("SELECT 1")
+        cur.fetchone()
+        times.append(perf_counter_ns() - t)
+    cur.close()
+    q = statistics.quantiles(times, n=100)
+    print(f"⏱️ SELECT 1 latency: p50={q[49] / 1e6:.2f}ms p95={q[94] / 1e6:.2f}ms p99={q[98] / 1e6:.2f}ms")
+
     conn.close()
 except Exception as e:
     print("❌ Connection failed:", e)